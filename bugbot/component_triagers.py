@@ -3,15 +3,16 @@
 # You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from dataclasses import dataclass
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
+from libmozdata import utils as lmdutils
 from libmozdata.bugzilla import BugzillaProduct
 
 from bugbot.components import ComponentName
 from bugbot.round_robin import RoundRobin
 
 
-@dataclass
+@dataclass(slots=True)
 class TriageOwner:
     component: ComponentName
     bugzilla_email: str
@@ -20,7 +21,7 @@ class TriageOwner:
 class ComponentTriagers:
     def __init__(
         self,
-        excluded_teams: List[str] = [],
+        excluded_teams: Optional[List[str]] = None,
     ) -> None:
         """Constructor
 
@@ -29,13 +30,17 @@ class ComponentTriagers:
         """
         self.round_robin: RoundRobin = RoundRobin.get_instance()
         self.triagers: Dict[ComponentName, str] = {}
-        products = [
-            ComponentName.from_str(pc).product
-            for pc in self.round_robin.get_components()
-        ]
+        # Several components in the rotation usually share the same product, so
+        # we deduplicate the names to keep the single product query short.
+        products = sorted(
+            {
+                ComponentName.from_str(pc).product
+                for pc in self.round_robin.get_components()
+            }
+        )
         self._fetch_triagers(
             products,
-            set(excluded_teams),
+            set(excluded_teams or ()),
         )
 
     def _fetch_triagers(
@@ -44,10 +49,13 @@ class ComponentTriagers:
         excluded_teams: Set[str],
     ) -> None:
         def handler(product, data):
+            product_name = product["name"]
             for component in product["components"]:
-                component_name = ComponentName(product["name"], component["name"])
-                if component["team_name"] not in excluded_teams:
-                    data[component_name] = component["triage_owner"]
+                if component["team_name"] in excluded_teams:
+                    continue
+
+                component_name = ComponentName(product_name, component["name"])
+                data[component_name] = component["triage_owner"]
 
         BugzillaProduct(
             product_names=products,
@@ -82,15 +90,26 @@ class ComponentTriagers:
             If the rotation source returns more than one person, the first one
             will be selected as the new triage owner.
         """
+        # Components without a rotation calendar always resolve to their
+        # current triage owner, so there is no need to look them up.
+        rotation_components = {
+            ComponentName.from_str(pc) for pc in self.round_robin.get_components()
+        }
+        # Resolve the date once instead of parsing "today" for every component.
+        today = lmdutils.get_date_ymd("today")
+
         triagers = []
         for component, current_triager in self.triagers.items():
+            if component not in rotation_components:
+                continue
+
             new_triager = self.round_robin.get(
                 {
                     "product": component.product,
                     "component": component.name,
                     "triage_owner": current_triager,
                 },
-                "today",
+                today,
                 only_one=True,
                 has_nick=False,
             )
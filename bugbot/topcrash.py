@@ -195,6 +195,10 @@ CRASH_SIGNATURE_BLOCK_PATTERNS = [
     "!^java.lang.OutOfMemoryError",
 ]
 
+# The maximum number of signatures that a query for the block patterns could
+# return.
+MAX_PATTERN_SIGNATURES_IN_REQUEST = 1000
+
 
 class Topcrash:
     def __init__(
@@ -226,21 +230,34 @@ class Topcrash:
         end_date = lmdutils.get_date_ymd(date)
         self.start_date = lmdutils.get_date_ymd(end_date - timedelta(duration))
         self.date_range = socorro.SuperSearch.get_search_date(self.start_date, end_date)
+        # The parameters that are shared by the queries of all criteria.
+        self._base_params = {
+            "date": self.date_range,
+            "_aggs.signature": [
+                "_cardinality.install_time",
+                "startup_crash",
+            ],
+            "_results_number": 0,
+        }
 
         self._blocked_signatures: Optional[Set[str]] = None
         self.__version_constrains: Optional[Dict[str, str]] = None
 
-    def _fetch_signatures_from_patterns(self, patterns) -> Set[str]:
-        MAX_SIGNATURES_IN_REQUEST = 1000
+    def _search_signatures_from_patterns(
+        self, patterns, signatures: Set[str]
+    ) -> socorro.SuperSearch:
+        """Send a query to collect the signatures that match the patterns.
 
-        signatures: Set[str] = set()
+        The query is sent without waiting for its response; the caller should
+        call `wait()` on the returned search before using `signatures`.
+        """
         params = {
             "date": self.date_range,
             "signature": [
                 pattern if pattern[0] != "!" else pattern[1:] for pattern in patterns
             ],
             "_results_number": 0,
-            "_facets_size": MAX_SIGNATURES_IN_REQUEST,
+            "_facets_size": MAX_PATTERN_SIGNATURES_IN_REQUEST,
         }
 
         def handler(search_resp: dict, data: set):
@@ -250,17 +267,11 @@ class Topcrash:
                 if signature["count"] >= self.min_crashes
             )
 
-        socorro.SuperSearch(
+        return socorro.SuperSearch(
             params=params,
             handler=handler,
             handlerdata=signatures,
-        ).wait()
-
-        assert (
-            len(signatures) < MAX_SIGNATURES_IN_REQUEST
-        ), "the patterns match more signatures than what the request could return, consider to increase the threshold"
-
-        return signatures
+        )
 
     def fetch_signature_volume(
         self,
@@ -309,12 +320,32 @@ class Topcrash:
 
         return signature_volume
 
-    def get_blocked_signatures(self) -> Set[str]:
-        """Return the list of signatures to be ignored."""
+    def get_blocked_signatures(
+        self, prefetch_version_constrains: bool = False
+    ) -> Set[str]:
+        """Return the list of signatures to be ignored.
+
+        Args:
+            prefetch_version_constrains: if True, the version constrains will be
+                fetched while the blocked signatures query is in flight.
+        """
         if self._blocked_signatures is None:
-            self._blocked_signatures = self._fetch_signatures_from_patterns(
-                self.signature_block_patterns
+            signatures: Set[str] = set()
+            search = self._search_signatures_from_patterns(
+                self.signature_block_patterns, signatures
             )
+            try:
+                if prefetch_version_constrains:
+                    self._fetch_version_constrains()
+            finally:
+                # Do not leave the query in flight if fetching the versions fails.
+                search.wait()
+
+            assert (
+                len(signatures) < MAX_PATTERN_SIGNATURES_IN_REQUEST
+            ), "the patterns match more signatures than what the request could return, consider to increase the threshold"
+
+            self._blocked_signatures = signatures
 
         return self._blocked_signatures
 
@@ -331,6 +362,13 @@ class Topcrash:
             list of criteria that the crash signature matches.
         """
 
+        # The queries need both the blocked signatures and the version
+        # constrains. Resolve them concurrently before building the queries, so
+        # that the queries are all sent without blocking in between.
+        self.get_blocked_signatures(prefetch_version_constrains=True)
+
+        # The queries are sent concurrently once created; we wait for all of
+        # them afterwards.
         data: dict = defaultdict(dict)
         searches = [
             socorro.SuperSearch(
@@ -348,27 +386,19 @@ class Topcrash:
         result = {}
         for _, signatures in data.items():
             for signature_name, signature_info in signatures.items():
-                if signature_name not in result:
-                    result[signature_name] = [signature_info]
-                else:
-                    result[signature_name].append(signature_info)
+                result.setdefault(signature_name, []).append(signature_info)
 
         return result
 
     def __get_params_from_criterion(self, criterion: dict):
         params = {
+            **self._base_params,
             "product": criterion["product"],
             "release_channel": criterion["channel"],
             "major_version": self._get_major_version_constrain(criterion["channel"]),
             "process_type": criterion.get("process_type"),
             "cpu_arch": criterion.get("cpu_arch"),
             "platform": criterion.get("platform"),
-            "date": self.date_range,
-            "_aggs.signature": [
-                "_cardinality.install_time",
-                "startup_crash",
-            ],
-            "_results_number": 0,
             "_facets_size": (
                 criterion.get("tc_startup_limit", criterion["tc_limit"])
                 # Because of the limitation in https://bugzilla.mozilla.org/show_bug.cgi?id=1257376#c9,
@@ -382,6 +412,13 @@ class Topcrash:
 
     def _get_major_version_constrain(self, channel: str) -> str:
         """Return the major version constrain for the given channel."""
+        return self._fetch_version_constrains()[channel]
+
+    def _fetch_version_constrains(self) -> Dict[str, str]:
+        """Fetch the major version constrains for all channels.
+
+        The constrains are cached after the first call.
+        """
         if self.__version_constrains is None:
             versions = lmdversions.get(base=True)
             last_release_date = lmdversions.getMajorDate(versions["release"])
@@ -401,7 +438,7 @@ class Topcrash:
                     "release": f""">={versions["release"]}""",
                 }
 
-        return self.__version_constrains[channel]
+        return self.__version_constrains
 
     @staticmethod
     def __is_startup_crash(signature: dict):
@@ -431,7 +468,7 @@ class Topcrash:
             rank = 0
             for signature in signatures:
                 if rank >= tc_startup_limit or signature["count"] < self.min_crashes:
-                    return
+                    break
 
                 name = signature["term"]
                 installations = signature["facets"]["cardinality_install_time"]["value"]
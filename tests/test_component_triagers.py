@@ -0,0 +1,47 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this file,
+# You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bugbot.component_triagers import ComponentName, ComponentTriagers, TriageOwner
+
+
+class TestComponentTriagers(unittest.TestCase):
+    def setUp(self):
+        round_robin = MagicMock()
+        round_robin.get_components.return_value = ["P1::C1", "P1::C2"]
+        round_robin.get.side_effect = lambda bug, *args, **kwargs: {
+            "C1": "new@mozilla.com",
+            "C2": "same@mozilla.com",
+        }[bug["component"]]
+
+        with patch(
+            "bugbot.component_triagers.RoundRobin.get_instance",
+            return_value=round_robin,
+        ), patch.object(ComponentTriagers, "_fetch_triagers"):
+            self.component_triagers = ComponentTriagers()
+
+        self.component_triagers.triagers = {
+            ComponentName("P1", "C1"): "old@mozilla.com",
+            ComponentName("P1", "C2"): "same@mozilla.com",
+            ComponentName("P1", "C3"): "other@mozilla.com",
+        }
+
+    def test_get_new_triage_owners(self):
+        new_triage_owners = self.component_triagers.get_new_triage_owners()
+
+        self.assertEqual(
+            new_triage_owners,
+            [TriageOwner(ComponentName("P1", "C1"), "new@mozilla.com")],
+        )
+
+    def test_get_new_triage_owners_skips_components_without_calendar(self):
+        self.component_triagers.get_new_triage_owners()
+
+        looked_up = [
+            call.args[0]["component"]
+            for call in self.component_triagers.round_robin.get.call_args_list
+        ]
+        self.assertEqual(sorted(looked_up), ["C1", "C2"])
@@ -2,7 +2,7 @@ import responses
 from libmozdata.socorro import Socorro
 
 from bugbot.auto_mock import MockTestCase
-from bugbot.topcrash import Topcrash
+from bugbot.topcrash import TOP_CRASH_IDENTIFICATION_CRITERIA, Topcrash
 
 
 class TestTopcrash(MockTestCase):
@@ -22,3 +22,9 @@ class TestTopcrash(MockTestCase):
         assert "OOM | small" in signatures
         assert "IPCError-browser | ShutDownKill" in signatures
         assert "EMPTY: no frame data available; StreamSizeMismatch" in signatures
+
+    def test_criteria_are_unique(self):
+        # Results are grouped by criterion name, so a duplicated criterion
+        # would only cost an extra query without adding any data.
+        names = [criterion["name"] for criterion in TOP_CRASH_IDENTIFICATION_CRITERIA]
+        assert len(names) == len(set(names))